@@ -0,0 +1,109 @@
+"""
+Compare receipt rendering of the layout engine against the previous formatter.
+
+Run from the project root:
+    python -m benchmarks.formatter_benchmark
+"""
+import timeit
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from utils.formatter import format_check_text, iter_checks_text
+from utils.money import from_minor
+from utils.payment_enum import PaymentType
+
+
+def legacy_format_check_text(check, width: int = 32) -> str:
+    """
+    Previous implementation of format_check_text, kept as the baseline.
+    """
+    def center(text: str) -> str:
+        return text.center(width)
+
+    def line(char='='):
+        return char * width
+
+    def format_product(p):
+        total = p.quantity * p.price
+        lines = []
+        qty_price = f"{p.quantity:.2f} x {p.price:,.2f}"
+        lines.append(qty_price)
+        lines.append(p.name.ljust(width - len(f"{total:,.2f}")) + f"{total:,.2f}")
+        return "\n".join(lines)
+
+    lines = [
+        center("ФОП Джонсонюк Борис"),
+        line(),
+    ]
+
+    for p in check.products:
+        lines.append(format_product(p))
+        lines.append('-' * width)
+
+    lines.append(line())
+    lines.append("СУМА".ljust(width - len(f"{check.total:,.2f}")) + f"{check.total:,.2f}")
+    lines.append(f"{check.payment_type.capitalize()}".ljust(
+        width - len(f"{check.payment_amount:,.2f}")) + f"{check.payment_amount:,.2f}")
+    change = check.payment_amount - check.total
+    lines.append("Решта".ljust(width - len(f"{change:,.2f}")) + f"{change:,.2f}")
+    lines.append(line())
+    lines.append(center(check.created_at.strftime("%d.%m.%Y %H:%M")))
+    lines.append(center("Дякуємо за покупку!"))
+
+    return "\n".join(lines)
+
+
+def make_check(products_count: int = 10):
+    """
+    Build a check-like object with the attributes used by the formatter, amounts in minor units.
+    """
+    products = [
+        SimpleNamespace(name=f"Product {i}", price=1250 + i * 100, quantity=i + 1, total=(1250 + i * 100) * (i + 1))
+        for i in range(products_count)
+    ]
+    total = sum(p.total for p in products)
+    return SimpleNamespace(
+        products=products,
+        total=total,
+        payment_type=PaymentType.cash,
+        payment_amount=total + 10000,
+        rest=10000,
+        created_at=datetime.now(timezone.utc),
+    )
+
+
+def to_legacy(check):
+    """
+    Convert a check from make_check to the float amounts the legacy formatter expects.
+    """
+    return SimpleNamespace(
+        products=[
+            SimpleNamespace(name=p.name, price=from_minor(p.price), quantity=p.quantity, total=from_minor(p.total))
+            for p in check.products
+        ],
+        total=from_minor(check.total),
+        payment_type=check.payment_type,
+        payment_amount=from_minor(check.payment_amount),
+        rest=from_minor(check.rest),
+        created_at=check.created_at,
+    )
+
+
+def main(number: int = 20000, batch_size: int = 500):
+    check = make_check()
+    legacy_check = to_legacy(check)
+    assert format_check_text(check) == legacy_format_check_text(legacy_check)
+
+    legacy = timeit.timeit(lambda: legacy_format_check_text(legacy_check), number=number)
+    layout = timeit.timeit(lambda: format_check_text(check), number=number)
+    print(f"single receipt x{number}: legacy {legacy:.3f}s, layout {layout:.3f}s ({legacy / layout:.2f}x)")
+
+    checks = [make_check() for _ in range(batch_size)]
+    legacy_checks = [to_legacy(c) for c in checks]
+    legacy = timeit.timeit(lambda: "\n\n".join(legacy_format_check_text(c) for c in legacy_checks), number=20)
+    layout = timeit.timeit(lambda: "".join(iter_checks_text(checks)), number=20)
+    print(f"batch of {batch_size} x20: legacy {legacy:.3f}s, layout {layout:.3f}s ({legacy / layout:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
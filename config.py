@@ -5,6 +5,15 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+def available_cpus() -> int:
+    """
+    Number of CPUs this process may run on (respects affinity / cpuset limits).
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
 class Config:
     SECRET_KEY = os.getenv("SECRET_KEY", "test-secret-key")
 
@@ -17,5 +26,15 @@ class Config:
     ALGORITHM = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+    BIND = os.getenv("BIND") or "0.0.0.0:8000"
+    WORKERS = int(os.getenv("WORKERS") or available_cpus())
+    WORKER_MAX_REQUESTS = int(os.getenv("WORKER_MAX_REQUESTS") or 10000)
+    WORKER_MAX_REQUESTS_JITTER = int(os.getenv("WORKER_MAX_REQUESTS_JITTER") or 1000)
+    WORKER_GRACEFUL_TIMEOUT = int(os.getenv("WORKER_GRACEFUL_TIMEOUT") or 30)
+
+    # Every worker has its own pool: WORKERS * (DB_POOL_SIZE + DB_MAX_OVERFLOW) connections at most
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE") or 5)
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW") or 5)
+
 
 config = Config()
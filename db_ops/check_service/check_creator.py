@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 
 from models.check_model import Check, CheckProduct
 from schemas.check_schema import CheckCreate
+from utils.money import from_minor
 
 
 class CheckCreator:
@@ -51,7 +52,7 @@ class CheckCreator:
         self.check_obj = Check(
             user_id=self.user_id,
             payment_type=self.check_data.payment.type,
-            payment_amount=self.check_data.payment.amount,
+            payment_amount=self.check_data.payment.amount_minor,
             additional_data=self.check_data.additional_data,
         )
         self.db.add(self.check_obj)
@@ -65,16 +66,16 @@ class CheckCreator:
             product_obj = CheckProduct(
                 check_id=self.check_obj.id,
                 name=product.name,
-                price=product.price,
+                price=product.price_minor,
                 quantity=product.quantity,
             )
             product_obj.calculate_total()
             self.db.add(product_obj)
             self.products_data.append({
                 "name": product_obj.name,
-                "price": product_obj.price,
+                "price": from_minor(product_obj.price),
                 "quantity": product_obj.quantity,
-                "total": product_obj.total,
+                "total": from_minor(product_obj.total),
             })
 
     def _finalize_check(self) -> None:
@@ -105,10 +106,10 @@ class CheckCreator:
             "products": self.products_data,
             "payment": {
                 "type": self.check_data.payment.type,
-                "amount": self.check_data.payment.amount,
+                "amount": from_minor(self.check_obj.payment_amount),
             },
-            "total": self.check_obj.total,
-            "rest": self.check_obj.rest,
+            "total": from_minor(self.check_obj.total),
+            "rest": from_minor(self.check_obj.rest),
             "created_at": self.check_obj.created_at,
             "additional_data": self.check_obj.additional_data,
         }
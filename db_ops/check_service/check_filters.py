@@ -18,7 +18,7 @@ def apply_check_filters(query, filters: CheckFilter):
     if filters.date_to:
         query = query.filter(Check.created_at <= filters.date_to)
     if filters.min_total:
-        query = query.filter(Check.total >= filters.min_total)
+        query = query.filter(Check.total >= filters.min_total_minor)
     if filters.payment_type:
         query = query.filter(Check.payment_type == filters.payment_type)
     return query
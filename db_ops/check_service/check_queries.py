@@ -1,10 +1,12 @@
-from typing import List
+from typing import Iterator, List
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from db_ops.check_service.check_filters import apply_check_filters
 from models.check_model import Check
-from schemas.check_schema import CheckFilter
+from schemas.check_schema import CheckFilter, CheckPrintFilter
+
+PRINT_CHUNK_SIZE = 200
 
 
 def get_checks(db: Session, current_user_id: int, filters: CheckFilter) -> List[Check]:
@@ -19,7 +21,11 @@ def get_checks(db: Session, current_user_id: int, filters: CheckFilter) -> List[
     Returns:
         List[Check]: List of Check objects matching the filters and user.
     """
-    query = db.query(Check).filter(Check.user_id == current_user_id)
+    query = (
+        db.query(Check)
+        .options(selectinload(Check.products))
+        .filter(Check.user_id == current_user_id)
+    )
     query = apply_check_filters(query, filters)
     query = query.order_by(Check.created_at.desc()) \
         .offset(filters.offset) \
@@ -45,3 +51,27 @@ def get_check_by_id(db: Session, current_user_id: int, check_id: int) -> Check |
         .filter(Check.id == check_id, Check.user_id == current_user_id)
         .first()
     )
+
+
+def iter_checks_for_print(db: Session, current_user_id: int, filters: CheckPrintFilter) -> Iterator[Check]:
+    """
+    Iterate over all checks of the current user in a date range, oldest first, fetched in chunks.
+
+    Args:
+        db (Session): Database session, must stay open while iterating.
+        current_user_id (int): ID of the current authenticated user.
+        filters (CheckPrintFilter): Date range and payment type.
+
+    Returns:
+        Iterator[Check]: Check objects with products loaded.
+    """
+    query = (
+        db.query(Check)
+        .options(selectinload(Check.products))
+        .filter(Check.user_id == current_user_id, Check.created_at >= filters.date_from)
+    )
+    if filters.date_to:
+        query = query.filter(Check.created_at <= filters.date_to)
+    if filters.payment_type:
+        query = query.filter(Check.payment_type == filters.payment_type)
+    return query.order_by(Check.created_at, Check.id).yield_per(PRINT_CHUNK_SIZE)
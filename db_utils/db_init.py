@@ -1,6 +1,88 @@
+from sqlalchemy import Column, Integer, Table, inspect, select, text
+from sqlalchemy.exc import DBAPIError
+
 from db_utils.base import Base
 from db_utils.session import engine
 
+SCHEMA_VERSION = 2
+SCHEMA_LOCK_ID = 7_310_526  # pg advisory lock key, serializes schema setup between workers
+
+schema_version = Table(
+    "schema_version",
+    Base.metadata,
+    Column("version", Integer, nullable=False),
+)
+
+
+def get_schema_version(connection) -> int | None:
+    """
+    Read the schema version stored in the database.
+
+    Args:
+        connection: SQLAlchemy connection.
+
+    Returns:
+        Optional[int]: Stored version, or None if the database was never versioned.
+    """
+    try:
+        with connection.begin_nested():
+            return connection.execute(select(schema_version.c.version)).scalar()
+    except DBAPIError:
+        return None
+
+
+def _set_schema_version(connection, version: int) -> None:
+    connection.execute(schema_version.delete())
+    connection.execute(schema_version.insert().values(version=version))
+
+
+def _migrate_money_to_minor_units(connection) -> None:
+    """
+    Version 2: convert Float money columns to BIGINT minor units and index checks.total.
+    """
+    connection.execute(text(
+        "ALTER TABLE checks "
+        "ALTER COLUMN total TYPE BIGINT USING round(total::numeric * 100), "
+        "ALTER COLUMN rest TYPE BIGINT USING round(rest::numeric * 100), "
+        "ALTER COLUMN payment_amount TYPE BIGINT USING round(payment_amount::numeric * 100)"
+    ))
+    connection.execute(text(
+        "ALTER TABLE check_products "
+        "ALTER COLUMN price TYPE BIGINT USING round(price::numeric * 100), "
+        "ALTER COLUMN total TYPE BIGINT USING round(total::numeric * 100)"
+    ))
+    connection.execute(text("CREATE INDEX IF NOT EXISTS ix_checks_total ON checks (total)"))
+
+
+# Upgrade steps keyed by the version they bring the schema to.
+MIGRATIONS = {
+    2: _migrate_money_to_minor_units,
+}
+
+
+def init_db(bind=engine):
+    """
+    Make sure the database schema is up to date.
+
+    On an up to date database this is a single SELECT. A new database gets
+    all tables created; an older one is upgraded through MIGRATIONS. Databases
+    created before versioning was introduced are treated as version 1.
+
+    Args:
+        bind: SQLAlchemy engine to initialize (default: application engine).
+    """
+    with bind.connect() as connection:
+        if get_schema_version(connection) == SCHEMA_VERSION:
+            return
 
-def init_db():
-    Base.metadata.create_all(bind=engine)
+    with bind.begin() as connection:
+        connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": SCHEMA_LOCK_ID})
+        version = get_schema_version(connection)
+        if version == SCHEMA_VERSION:
+            return
+        if version is None:
+            version = 1 if inspect(connection).has_table("checks") else SCHEMA_VERSION
+        Base.metadata.create_all(bind=connection)
+        for target in range(version + 1, SCHEMA_VERSION + 1):
+            MIGRATIONS[target](connection)
+        _set_schema_version(connection, SCHEMA_VERSION)
@@ -3,11 +3,23 @@ from sqlalchemy.orm import sessionmaker
 
 from config import config
 
-engine = create_engine(config.DATABASE_URL)
+engine = create_engine(
+    config.DATABASE_URL,
+    pool_size=config.DB_POOL_SIZE,
+    max_overflow=config.DB_MAX_OVERFLOW,
+)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+def get_session_factory():
+    """
+    Provide the session factory for endpoints that manage the session lifetime themselves
+    (e.g. keep it open while a response is streamed).
+    """
+    return SessionLocal
+
+
 def get_db():
     db = SessionLocal()
     try:
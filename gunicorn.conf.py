@@ -0,0 +1,24 @@
+"""
+Production server settings, used as: gunicorn -c gunicorn.conf.py main:app
+"""
+# Module level names here are read as gunicorn settings, "config" is one of them.
+from config import config as app_config
+
+bind = app_config.BIND
+workers = app_config.WORKERS
+worker_class = "uvicorn_worker.UvicornWorker"
+
+# Import the app once in the master, workers are forked with everything loaded.
+preload_app = True
+
+# Recycle workers after a number of requests, jitter keeps them from restarting together.
+max_requests = app_config.WORKER_MAX_REQUESTS
+max_requests_jitter = app_config.WORKER_MAX_REQUESTS_JITTER
+graceful_timeout = app_config.WORKER_GRACEFUL_TIMEOUT
+keepalive = 5
+
+
+def post_fork(server, worker):
+    # Connections must not be shared between processes, each worker opens its own pool.
+    from db_utils.session import engine
+    engine.dispose(close=False)
@@ -1,15 +1,19 @@
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.exceptions import RequestValidationError
 
 from db_utils.db_init import init_db
-from routers import auth, check
+from routers import auth, check, health
+from utils.exception_handlers import validation_exception_handler
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     init_db()
     yield
 app = FastAPI(lifespan=lifespan)
+app.add_exception_handler(RequestValidationError, validation_exception_handler)
 
 app.include_router(auth.router, prefix="/auth", tags=["auth"])
 app.include_router(check.router, prefix="/checks", tags=["checks"])
+app.include_router(health.router, tags=["health"])
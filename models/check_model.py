@@ -1,22 +1,26 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, JSON, Float, String, Enum
+from sqlalchemy import BigInteger, Column, Integer, ForeignKey, DateTime, JSON, Float, String, Enum
 from sqlalchemy.orm import relationship
 
 from db_utils.base import Base
+from utils.money import MAX_MINOR_AMOUNT, from_minor
 from utils.payment_enum import PaymentType
 
 
 class Check(Base):
+    """
+    Money columns (total, rest, payment_amount) are stored in integer minor units.
+    """
     __tablename__ = "checks"
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
-    total = Column(Float)
-    rest = Column(Float)
+    total = Column(BigInteger, index=True)
+    rest = Column(BigInteger)
     payment_type = Column(Enum(PaymentType), nullable=False)
-    payment_amount = Column(Float)
+    payment_amount = Column(BigInteger)
     created_at = Column(DateTime, default=datetime.now(timezone.utc))
     additional_data = Column(JSON, nullable=True)
     public_token = Column(String, unique=True, default=lambda: uuid.uuid4().hex)
@@ -25,10 +29,13 @@ class Check(Base):
     products = relationship("CheckProduct", back_populates="check")
 
     def calculate_total(self):
-        self.total = round(sum(p.total for p in self.products), 2)
+        total = sum(p.total for p in self.products)
+        if total > MAX_MINOR_AMOUNT:
+            raise ValueError("Total amount is too large")
+        self.total = total
 
     def calculate_rest(self):
-        rest = round(self.payment_amount - self.total, 2)
+        rest = self.payment_amount - self.total
         if rest < 0:
             raise ValueError("Payment amount is less than total amount due")  # <-- I suppose it cannot be minus
         self.rest = rest
@@ -39,33 +46,37 @@ class Check(Base):
             "products": [
                 {
                     "name": p.name,
-                    "price": p.price,
+                    "price": from_minor(p.price),
                     "quantity": p.quantity,
-                    "total": p.total,
+                    "total": from_minor(p.total),
                 }
                 for p in self.products
             ],
             "payment": {
                 "type": self.payment_type,
-                "amount": self.payment_amount,
+                "amount": from_minor(self.payment_amount),
             },
-            "total": self.total,
-            "rest": self.rest,
+            "total": from_minor(self.total),
+            "rest": from_minor(self.rest),
             "created_at": self.created_at,
+            "additional_data": self.additional_data,
         }
 
 
 class CheckProduct(Base):
+    """
+    Money columns (price, total) are stored in integer minor units.
+    """
     __tablename__ = "check_products"
 
     id = Column(Integer, primary_key=True)
     check_id = Column(Integer, ForeignKey("checks.id"))
     name = Column(String)
-    price = Column(Float)
+    price = Column(BigInteger)
     quantity = Column(Float)
-    total = Column(Float)
+    total = Column(BigInteger)
 
     check = relationship("Check", back_populates="products")
 
     def calculate_total(self):
-        self.total = round(self.price * self.quantity, 2)
+        self.total = round(self.price * self.quantity)
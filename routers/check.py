@@ -1,16 +1,19 @@
-from typing import List
+from itertools import chain
+from typing import Callable, List, Literal
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
+from starlette.background import BackgroundTask
 
 from db_ops.check_service.check_creator import CheckCreator
-from db_ops.check_service.check_queries import get_checks, get_check_by_id
-from db_utils.session import get_db
+from db_ops.check_service.check_queries import get_checks, get_check_by_id, iter_checks_for_print
+from db_utils.session import get_db, get_session_factory
 from deps.auth_dependancy import get_current_user
 from models.check_model import Check
 from models.user_model import User
-from schemas.check_schema import CheckCreate, CheckResponse, CheckFilter
-from utils.formatter import format_check_text
+from schemas.check_schema import CheckCreate, CheckResponse, CheckFilter, CheckPrintFilter
+from utils.formatter import format_check_text, iter_checks_escpos, iter_checks_text
 
 router = APIRouter()
 
@@ -53,6 +56,46 @@ def read_checks(
     return [CheckResponse(**check.to_dict()) for check in checks]
 
 
+@router.get("/print", response_class=StreamingResponse)
+def print_checks(
+        filters: CheckPrintFilter = Depends(),
+        output: Literal["text", "escpos"] = Query("text"),
+        line_width: int = Query(32, gt=10, le=80),
+        session_factory: Callable[[], Session] = Depends(get_session_factory),
+        current_user: User = Depends(get_current_user),
+):
+    """
+    Render all checks of the authenticated user in a date range as one streamed response
+    (e.g. to reprint a shift), oldest first.
+
+    Args:
+        filters (CheckPrintFilter): Date range and payment type.
+        output (str): "text" for plain text receipts, "escpos" for thermal printer commands.
+        line_width (int): Formatting line width (default 32).
+        session_factory (Callable[[], Session]): Factory for the session used while streaming.
+        current_user (User): Authenticated user.
+
+    Returns:
+        StreamingResponse: Receipts rendered one after another.
+    """
+    render = iter_checks_escpos if output == "escpos" else iter_checks_text
+    media_type = "application/octet-stream" if output == "escpos" else "text/plain; charset=utf-8"
+
+    # Rows are fetched while streaming, so the session lives as long as the response.
+    # The first chunk is fetched here, so query errors are reported before the headers are sent.
+    db = session_factory()
+    try:
+        checks = iter(iter_checks_for_print(db=db, current_user_id=current_user.id, filters=filters))
+        first = next(checks, None)
+    except Exception:
+        db.close()
+        raise
+    if first is not None:
+        checks = chain((first,), checks)
+
+    return StreamingResponse(render(checks, line_width), media_type=media_type, background=BackgroundTask(db.close))
+
+
 @router.get("/{check_id}", response_model=CheckResponse)
 def read_check(check_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
     """
@@ -72,7 +115,7 @@ def read_check(check_id: int, db: Session = Depends(get_db), current_user: User
     db_check = get_check_by_id(db=db, current_user_id=current_user.id, check_id=check_id)
     if db_check is None or db_check.user_id != current_user.id:
         raise HTTPException(status_code=404, detail="Check not found")
-    return db_check
+    return CheckResponse(**db_check.to_dict())
 
 
 @router.get("/public/{token}", response_class=Response)
@@ -0,0 +1,40 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from db_utils.session import get_db
+
+router = APIRouter()
+
+
+@router.get("/health")
+def health():
+    """
+    Liveness probe, answers as long as the worker is running.
+
+    Returns:
+        dict: Service status.
+    """
+    return {"status": "ok"}
+
+
+@router.get("/ready")
+def ready(db: Session = Depends(get_db)):
+    """
+    Readiness probe, checks that the database is reachable.
+
+    Args:
+        db (Session): Database session.
+
+    Raises:
+        HTTPException: If the database is not available.
+
+    Returns:
+        dict: Service status.
+    """
+    try:
+        db.execute(text("SELECT 1"))
+    except SQLAlchemyError:
+        raise HTTPException(status_code=503, detail="Database is not available")
+    return {"status": "ready"}
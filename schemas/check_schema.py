@@ -1,20 +1,35 @@
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
+from utils.money import MAX_AMOUNT, check_minor_precision, to_minor
 from utils.payment_enum import PaymentType
 
+MAX_QUANTITY = 1_000_000
+
 
 class Product(BaseModel):
     name: str
-    price: float = Field(gt=0, description="Price must be greater than 0")
-    quantity: int = Field(gt=0, description="Quantity must be greater than 0")
+    price: float = Field(ge=0.01, le=MAX_AMOUNT, description="Price must be between 0.01 and 1,000,000,000")
+    quantity: int = Field(gt=0, le=MAX_QUANTITY, description="Quantity must be between 1 and 1,000,000")
+
+    _check_price_precision = field_validator("price")(check_minor_precision)
+
+    @property
+    def price_minor(self) -> int:
+        return to_minor(self.price)
 
 
 class Payment(BaseModel):
     type: PaymentType
-    amount: float = Field(gt=0, description="Amount must be greater than 0")
+    amount: float = Field(ge=0.01, le=MAX_AMOUNT, description="Amount must be between 0.01 and 1,000,000,000")
+
+    _check_amount_precision = field_validator("amount")(check_minor_precision)
+
+    @property
+    def amount_minor(self) -> int:
+        return to_minor(self.amount)
 
 
 class CheckCreate(BaseModel):
@@ -54,10 +69,23 @@ class CheckResponse(BaseModel):
 class CheckFilter(BaseModel):
     date_from: Optional[datetime] = Field(None, description="Date create from")
     date_to: Optional[datetime] = Field(None, description="Date create to")
-    min_total: Optional[float] = Field(None, description="Total price minimum")
+    min_total: Optional[float] = Field(None, allow_inf_nan=False, description="Total price minimum")
     payment_type: Optional[str] = Field(None, description="type of payment")
     limit: int = Field(10, ge=10, le=100, description="items quantity per page")
     offset: int = Field(0, ge=0, description="offset")
 
+    @property
+    def min_total_minor(self) -> Optional[int]:
+        return to_minor(self.min_total) if self.min_total is not None else None
+
+    class Config:
+        extra = "forbid"
+
+
+class CheckPrintFilter(BaseModel):
+    date_from: datetime = Field(description="Date create from")
+    date_to: Optional[datetime] = Field(None, description="Date create to")
+    payment_type: Optional[PaymentType] = Field(None, description="type of payment")
+
     class Config:
         extra = "forbid"
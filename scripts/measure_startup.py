@@ -0,0 +1,56 @@
+"""
+Measure cold start of the production server: time from launching gunicorn
+until GET /ready answers 200 (app imported, workers forked, schema checked).
+
+Run from the project root with the database configured in .env reachable:
+    python -m scripts.measure_startup [workers] [runs]
+"""
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+HOST, PORT = "127.0.0.1", 8077
+TIMEOUT = 30
+
+
+def measure(workers: int) -> float:
+    with socket.socket() as probe:
+        if probe.connect_ex((HOST, PORT)) == 0:
+            sys.exit(f"Port {PORT} is already in use")
+
+    env = dict(os.environ, WORKERS=str(workers), BIND=f"{HOST}:{PORT}")
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "main:app"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - start < TIMEOUT:
+            try:
+                with urllib.request.urlopen(f"http://{HOST}:{PORT}/ready", timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - start
+            except OSError:
+                time.sleep(0.01)
+        sys.exit(f"Server did not become ready in {TIMEOUT}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main(workers: int = 1, runs: int = 5) -> None:
+    timings = [measure(workers) for _ in range(runs)]
+    print(
+        f"workers={workers} runs={runs}: "
+        f"min {min(timings):.2f}s, median {statistics.median(timings):.2f}s, max {max(timings):.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,34 @@
+import math
+
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse
+
+
+def _json_safe(value):
+    """
+    Replace non-finite floats (inf, nan), which JSON cannot represent, with their string form.
+    """
+    if isinstance(value, float) and not math.isfinite(value):
+        return str(value)
+    if isinstance(value, dict):
+        return {key: _json_safe(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(item) for item in value]
+    return value
+
+
+async def validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
+    """
+    Return validation errors as 422 like FastAPI does, also when the rejected input is
+    a non-finite number (the JSON parser accepts Infinity and NaN).
+
+    Args:
+        request (Request): Incoming request.
+        exc (RequestValidationError): Validation error raised by FastAPI.
+
+    Returns:
+        JSONResponse: 422 response with the error details.
+    """
+    return JSONResponse(status_code=422, content={"detail": _json_safe(jsonable_encoder(exc.errors()))})
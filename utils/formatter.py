@@ -1,3 +1,133 @@
+from functools import lru_cache
+from io import StringIO
+from typing import Iterable, Iterator
+
+from utils.money import format_minor
+
+SHOP_NAME = "ФОП Джонсонюк Борис"
+THANKS_TEXT = "Дякуємо за покупку!"
+
+ESC_POS_INIT = b"\x1b@"
+ESC_POS_FEED_AND_CUT = b"\x1dVB\x00"
+# ESC t code page number and the matching Python codec, WPC1251 covers Ukrainian letters (і, ї, є, ґ)
+ESC_POS_CODEPAGE, ESC_POS_ENCODING = 46, "cp1251"
+ESC_POS_SELECT_CODEPAGE = bytes((0x1b, 0x74, ESC_POS_CODEPAGE))
+
+
+class ReceiptLayout:
+    """
+    Precompiled receipt template for a single line width.
+
+    All width-dependent parts (header, separators, footer) are built once, so
+    rendering a check only formats its amounts and product rows.
+    """
+
+    def __init__(self, width: int = 32):
+        """
+        Initialize ReceiptLayout.
+
+        Args:
+            width (int): Total line width for formatting (gt=10, le=80).
+        """
+        self.width = width
+        rule = "=" * width + "\n"
+        self.header = SHOP_NAME.center(width) + "\n" + rule
+        self.separator = "-" * width + "\n"
+        self.rule = rule
+        self.footer_thanks = "\n" + THANKS_TEXT.center(width)
+
+    def _row(self, label: str, amount: int) -> str:
+        """
+        Build a line with the label on the left and the amount (in minor units) aligned right.
+        """
+        amount_text = format_minor(amount)
+        return label.ljust(self.width - len(amount_text)) + amount_text + "\n"
+
+    def write(self, check, buffer: StringIO) -> None:
+        """
+        Render a check into an existing text buffer.
+
+        Args:
+            check: Check object containing products, totals, payment info, and timestamps.
+            buffer (StringIO): Buffer the receipt text is appended to.
+        """
+        write = buffer.write
+        row = self._row
+        separator = self.separator
+
+        write(self.header)
+        for p in check.products:
+            write(f"{p.quantity:.2f} x {format_minor(p.price)}\n{row(p.name, p.total)}{separator}")
+
+        rest = check.rest if check.rest is not None else check.payment_amount - check.total
+        write(self.rule)
+        write(row("СУМА", check.total))
+        write(row(check.payment_type.capitalize(), check.payment_amount))
+        write(row("Решта", rest))
+        write(self.rule)
+        write(check.created_at.strftime("%d.%m.%Y %H:%M").center(self.width))
+        write(self.footer_thanks)
+
+    def render(self, check) -> str:
+        """
+        Render a check into a text receipt.
+
+        Args:
+            check: Check object containing products, totals, payment info, and timestamps.
+
+        Returns:
+            str: Formatted text receipt as a string.
+        """
+        buffer = StringIO()
+        self.write(check, buffer)
+        return buffer.getvalue()
+
+    @staticmethod
+    def to_escpos(text: str) -> bytes:
+        """
+        Wrap rendered receipt text into ESC/POS printer commands.
+
+        Args:
+            text (str): Receipt text produced by render or write.
+
+        Returns:
+            bytes: Printer commands with the receipt text, followed by feed and cut.
+        """
+        return b"".join((
+            ESC_POS_INIT,
+            ESC_POS_SELECT_CODEPAGE,
+            text.encode(ESC_POS_ENCODING, errors="replace"),
+            b"\n",
+            ESC_POS_FEED_AND_CUT,
+        ))
+
+    def render_escpos(self, check) -> bytes:
+        """
+        Render a check into an ESC/POS byte stream for thermal printers.
+
+        Args:
+            check: Check object containing products, totals, payment info, and timestamps.
+
+        Returns:
+            bytes: Printer commands with the receipt text, followed by feed and cut.
+        """
+        return self.to_escpos(self.render(check))
+
+
+@lru_cache(maxsize=128)
+def get_layout(width: int = 32) -> ReceiptLayout:
+    """
+    Return the cached receipt layout for the given line width.
+
+    Args:
+        width (int): Total line width for formatting (gt=10, le=80).
+
+    Returns:
+        ReceiptLayout: Precompiled layout shared between calls.
+    """
+    return ReceiptLayout(width)
+
+
 def format_check_text(check, width: int = 32) -> str:
     """
     Format a check object into a nicely centered and aligned text receipt.
@@ -9,37 +139,49 @@ def format_check_text(check, width: int = 32) -> str:
     Returns:
         str: Formatted text receipt as a string.
     """
-    def center(text: str) -> str:
-        return text.center(width)
-
-    def line(char='='):
-        return char * width
-
-    def format_product(p):
-        total = p.quantity * p.price
-        lines = []
-        qty_price = f"{p.quantity:.2f} x {p.price:,.2f}"
-        lines.append(qty_price)
-        lines.append(p.name.ljust(width - len(f"{total:,.2f}")) + f"{total:,.2f}")
-        return "\n".join(lines)
-
-    lines = [
-        center("ФОП Джонсонюк Борис"),
-        line(),
-    ]
-
-    for p in check.products:
-        lines.append(format_product(p))
-        lines.append('-' * width)
-
-    lines.append(line())
-    lines.append("СУМА".ljust(width - len(f"{check.total:,.2f}")) + f"{check.total:,.2f}")
-    lines.append(f"{check.payment_type.capitalize()}".ljust(
-        width - len(f"{check.payment_amount:,.2f}")) + f"{check.payment_amount:,.2f}")
-    change = check.payment_amount - check.total
-    lines.append("Решта".ljust(width - len(f"{change:,.2f}")) + f"{change:,.2f}")
-    lines.append(line())
-    lines.append(center(check.created_at.strftime("%d.%m.%Y %H:%M")))
-    lines.append(center("Дякуємо за покупку!"))
-
-    return "\n".join(lines)
+    return get_layout(width).render(check)
+
+
+def iter_checks_text(checks: Iterable, width: int = 32) -> Iterator[str]:
+    """
+    Render many checks one by one as text receipts, separated by blank lines.
+
+    A single buffer is reused for all receipts.
+
+    Args:
+        checks (Iterable): Check objects to render.
+        width (int): Total line width for formatting (default=32) (gt=10, le=80)
+
+    Yields:
+        str: Formatted text receipt followed by a separator.
+    """
+    layout = get_layout(width)
+    buffer = StringIO()
+    for check in checks:
+        layout.write(check, buffer)
+        buffer.write("\n\n")
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def iter_checks_escpos(checks: Iterable, width: int = 32) -> Iterator[bytes]:
+    """
+    Render many checks one by one as ESC/POS byte streams, each ending with a cut.
+
+    A single buffer is reused for all receipts.
+
+    Args:
+        checks (Iterable): Check objects to render.
+        width (int): Total line width for formatting (default=32) (gt=10, le=80)
+
+    Yields:
+        bytes: Printer commands for a single receipt.
+    """
+    layout = get_layout(width)
+    buffer = StringIO()
+    for check in checks:
+        layout.write(check, buffer)
+        yield layout.to_escpos(buffer.getvalue())
+        buffer.seek(0)
+        buffer.truncate()
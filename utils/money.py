@@ -0,0 +1,67 @@
+import math
+from decimal import Decimal, ROUND_HALF_UP
+
+MINOR_UNITS = 100
+# Upper bound for a single price or payment, in major units
+MAX_AMOUNT = 1_000_000_000
+# Largest value of a BIGINT money column, in minor units
+MAX_MINOR_AMOUNT = 2 ** 63 - 1
+
+
+def to_minor(amount: float) -> int:
+    """
+    Convert an amount in major units (e.g. 12.35) to integer minor units (1235).
+
+    Args:
+        amount (float): Amount in major units.
+
+    Returns:
+        int: Amount in minor units, rounded half up.
+    """
+    return int((Decimal(str(amount)) * MINOR_UNITS).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+def check_minor_precision(amount: float) -> float:
+    """
+    Make sure an amount can be stored in minor units without rounding.
+
+    Args:
+        amount (float): Amount in major units.
+
+    Raises:
+        ValueError: If the amount is not finite or has more than 2 decimal places.
+
+    Returns:
+        float: The same amount.
+    """
+    if not math.isfinite(amount):
+        raise ValueError("Amount must be a finite number")
+    if Decimal(str(amount)) * MINOR_UNITS != to_minor(amount):
+        raise ValueError("Amount must have at most 2 decimal places")
+    return amount
+
+
+def from_minor(amount: int) -> float:
+    """
+    Convert integer minor units back to major units for API responses.
+
+    Args:
+        amount (int): Amount in minor units.
+
+    Returns:
+        float: Amount in major units.
+    """
+    return amount / MINOR_UNITS
+
+
+def format_minor(amount: int) -> str:
+    """
+    Format minor units as a major-unit amount with thousands separators, e.g. 123456 -> "1,234.56".
+
+    Args:
+        amount (int): Amount in minor units.
+
+    Returns:
+        str: Formatted amount with two decimal places.
+    """
+    return f"{amount / MINOR_UNITS:,.2f}"